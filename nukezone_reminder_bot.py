@@ -1,20 +1,98 @@
 import os
-import re
+import math
+import time
+import heapq
+import logging
 import asyncio
 import aiosqlite
+from collections import OrderedDict
+from functools import lru_cache
 from datetime import datetime, timedelta, timezone
-from dateutil import parser as dtparser
 import discord
 from discord import app_commands
 
 DB_PATH = "nukezone_actions.sqlite"
+# journal_mode=WAL is persisted in the DB file by init_db; the rest apply to the open connection
+DB_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA busy_timeout=5000",
+    # let the WAL grow to ~4000 pages before checkpointing, so bursts of commits stay sequential appends
+    "PRAGMA wal_autocheckpoint=4000",
+)
+
+log = logging.getLogger("nukezone")
 
-intents = discord.Intents.default()
-bot = discord.Client(intents=intents)
+# Slash commands only: guilds is enough for get_channel to resolve channels from cache
+intents = discord.Intents.none()
+intents.guilds = True
+bot = discord.Client(intents=intents, chunk_guilds_at_startup=False, max_messages=None)
 tree = app_commands.CommandTree(bot)
+DB: aiosqlite.Connection | None = None  # opened once in setup_hook, shared by all commands
+
+# Pending reminders as (ends_at_ts, id), drained by a single _scheduler task.
+# The scheduler waits FIRE_WINDOW seconds past the earliest due time, then fires everything
+# due by then as one batch (at most FIRE_BATCH_MAX ids), so nothing fires before its end time.
+FIRE_WINDOW = 0.25
+FIRE_BATCH_MAX = 500
+_heap: list[tuple[int, int]] = []
+_wake = asyncio.Event()
+_scheduler_task: asyncio.Task | None = None
+_fire_tasks: set[asyncio.Task] = set()  # strong refs so in-flight batches aren't garbage-collected
+
+# Resolved reminder channels, most recently used last; avoids repeat fetch_channel calls
+CHANNEL_CACHE_SIZE = 512
+_channel_cache: OrderedDict[int, discord.abc.Messageable] = OrderedDict()
+# In-flight fetch_channel calls, shared by concurrent reminders for the same channel
+_channel_lookups: dict[int, asyncio.Task] = {}
+# channel_id -> time.monotonic() of the last failed fetch, oldest first; not retried for CHANNEL_MISS_TTL
+# seconds. Expired entries are pruned on each lookup and the size is capped at CHANNEL_CACHE_SIZE.
+CHANNEL_MISS_TTL = 300
+_channel_misses: OrderedDict[int, float] = OrderedDict()
 
 # --------- Utilities ---------
-DUR_RE = re.compile(r"(?:(?P<days>\d+)d)?\s*(?:(?P<hours>\d+)h)?\s*(?:(?P<mins>\d+)m)?\s*(?:(?P<secs>\d+)s)?", re.I)
+DUR_UNITS = {"d": 86400, "h": 3600, "m": 60, "s": 1}
+DUR_ERROR = "Could not parse duration. Try formats like '8h', '8h30m', '45m', '1d2h', or a datetime like '2025-10-22 23:40'."
+DT_FORMATS = ("%Y-%m-%d %H:%M", "%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M")
+
+def _parse_datetime(s: str) -> datetime | None:
+    try:
+        return datetime.fromisoformat(s)  # accepts " " or "T" as the separator
+    except ValueError:
+        pass
+    for fmt in DT_FORMATS:
+        try:
+            return datetime.strptime(s, fmt)
+        except ValueError:
+            continue
+    return None
+
+def _parse_duration(s: str) -> timedelta:
+    # Scan "<digits><unit>" pairs by hand, e.g. '1d2h30m', '1d 2h' or '8 h'.
+    # Units must appear at most once and in d, h, m, s order, as the old regex required.
+    total = 0
+    last_unit = DUR_UNITS["d"] + 1
+    i, n = 0, len(s)
+    while i < n:
+        if s[i] == " ":
+            i += 1
+            continue
+        j = i
+        while j < n and "0" <= s[j] <= "9":
+            j += 1
+        digits_end = j
+        while j < n and s[j] == " ":
+            j += 1
+        if digits_end == i or j == n:
+            raise ValueError(DUR_ERROR)
+        unit = DUR_UNITS.get(s[j].lower())
+        if unit is None or unit >= last_unit:
+            raise ValueError(DUR_ERROR)
+        total += int(s[i:digits_end]) * unit
+        last_unit = unit
+        i = j + 1
+    return timedelta(seconds=total)
 
 def parse_duration_or_time(s: str, now_utc: datetime) -> datetime:
     """
@@ -22,106 +100,205 @@ def parse_duration_or_time(s: str, now_utc: datetime) -> datetime:
     Returns a UTC datetime for when it ends.
     """
     s = s.strip()
-    # Try absolute time first
-    try:
-        dt = dtparser.parse(s)
+    # Digits and spaces with at least one unit letter can't be a datetime, so skip straight to the
+    # duration scanner (bare digits may be an ISO basic date like '20251022', so those still try fromisoformat)
+    looks_like_duration = (
+        s[:1].isdigit()
+        and all(c.isdigit() or c.lower() in "dhms " for c in s)
+        and any(c in "dhmsDHMS" for c in s)
+    )
+    # Otherwise try absolute time first
+    dt = None if looks_like_duration else _parse_datetime(s)
+    if dt is not None:
         if dt.tzinfo is None:
             # assume local-ish → treat as UTC to keep it simple; adjust as needed
             dt = dt.replace(tzinfo=timezone.utc)
         else:
             dt = dt.astimezone(timezone.utc)
         return dt
-    except Exception:
-        pass
 
     # Try duration pattern
-    m = DUR_RE.fullmatch(s.replace(" ", ""))
-    if not m:
-        raise ValueError("Could not parse duration. Try formats like '8h', '8h30m', '45m', '1d2h', or a datetime like '2025-10-22 23:40'.")
-    days = int(m.group("days") or 0)
-    hours = int(m.group("hours") or 0)
-    mins = int(m.group("mins") or 0)
-    secs = int(m.group("secs") or 0)
-    delta = timedelta(days=days, hours=hours, minutes=mins, seconds=secs)
+    delta = _parse_duration(s)
     if delta.total_seconds() <= 0:
         raise ValueError("Duration must be > 0.")
     return now_utc + delta
 
+@lru_cache(maxsize=1024)
+def _fmt_minute(y: int, m: int, d: int, h: int, mi: int) -> str:
+    return f"{y:04d}-{m:02d}-{d:02d} {h:02d}:{mi:02d} UTC"
+
 def fmt_dt(dt_utc: datetime) -> str:
-    return dt_utc.astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+    if dt_utc.tzinfo is not timezone.utc:
+        dt_utc = dt_utc.astimezone(timezone.utc)
+    return _fmt_minute(dt_utc.year, dt_utc.month, dt_utc.day, dt_utc.hour, dt_utc.minute)
+
+def fmt_remaining(secs: int) -> str:
+    h, rem = divmod(secs, 3600)
+    return f"{h}h {rem // 60}m"
+
+async def open_db():
+    global DB
+    if DB is not None:
+        return
+    DB = await aiosqlite.connect(DB_PATH)
+    DB.row_factory = aiosqlite.Row
+    for pragma in DB_PRAGMAS:
+        await DB.execute(pragma)
+
+async def close_db():
+    global DB
+    if DB is not None:
+        await DB.close()
+        DB = None
 
 async def init_db():
-    async with aiosqlite.connect(DB_PATH) as db:
-        await db.execute("""
-        CREATE TABLE IF NOT EXISTS actions (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            guild_id INTEGER NOT NULL,
-            user_id INTEGER NOT NULL,
-            channel_id INTEGER NOT NULL,
-            action_type TEXT NOT NULL,
-            target TEXT NOT NULL,
-            note TEXT,
-            created_at TEXT NOT NULL,
-            ends_at TEXT NOT NULL,
-            done INTEGER NOT NULL DEFAULT 0
-        );
-        """)
-        await db.commit()
-
-async def schedule_task(row: dict):
-    # Create an asyncio task that sleeps until due, then posts the reminder
-    now = datetime.now(timezone.utc)
-    ends_at = datetime.fromisoformat(row["ends_at"])
-    delay = (ends_at - now).total_seconds()
-    if delay < 0:
-        delay = 0
-
-    async def worker():
-        await asyncio.sleep(delay)
-        # double-check not done/canceled
-        async with aiosqlite.connect(DB_PATH) as db:
-            db.row_factory = aiosqlite.Row
-            cur = await db.execute("SELECT * FROM actions WHERE id=? AND done=0", (row["id"],))
-            rec = await cur.fetchone()
-            if not rec:
-                return  # already done/canceled
-            # mark done
-            await db.execute("UPDATE actions SET done=1 WHERE id=?", (row["id"],))
-            await db.commit()
-
-        channel = bot.get_channel(rec["channel_id"])
-        if channel is None:
-            # Fallback: try fetch
-            try:
-                channel = await bot.fetch_channel(rec["channel_id"])
-            except Exception:
-                channel = None
-
-        mention = f"<@{rec['user_id']}>"
-        msg = (
-            f"{mention} **NukeZone action complete!**\n"
-            f"• **Type:** {rec['action_type']}\n"
-            f"• **Target:** {rec['target']}\n"
-            f"• **Finished:** {fmt_dt(datetime.fromisoformat(rec['ends_at']))}"
+    await DB.execute("PRAGMA journal_mode=WAL")
+    await DB.execute("""
+    CREATE TABLE IF NOT EXISTS actions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        guild_id INTEGER NOT NULL,
+        user_id INTEGER NOT NULL,
+        channel_id INTEGER NOT NULL,
+        action_type TEXT NOT NULL,
+        target TEXT NOT NULL,
+        note TEXT,
+        created_at TEXT NOT NULL,
+        ends_at TEXT NOT NULL,
+        done INTEGER NOT NULL DEFAULT 0,
+        ends_at_ts INTEGER NOT NULL DEFAULT 0
+    );
+    """)
+    # Migrate older DBs: add ends_at_ts (unix seconds) and backfill it from ends_at
+    cur = await DB.execute("PRAGMA table_info(actions)")
+    if "ends_at_ts" not in [c["name"] for c in await cur.fetchall()]:
+        await DB.execute("ALTER TABLE actions ADD COLUMN ends_at_ts INTEGER NOT NULL DEFAULT 0")
+        await DB.execute("DROP INDEX IF EXISTS idx_actions_guild_user_pending")
+        await DB.execute("DROP INDEX IF EXISTS idx_actions_pending")
+        cur = await DB.execute("SELECT id, ends_at FROM actions")
+        await DB.executemany(
+            "UPDATE actions SET ends_at_ts=? WHERE id=?",
+            [(math.ceil(datetime.fromisoformat(r["ends_at"]).timestamp()), r["id"]) for r in await cur.fetchall()]
         )
-        if rec["note"]:
-            msg += f"\n• **Note:** {rec['note']}"
+    # /action_list lookups, and the pending scan in load_and_schedule_all
+    await DB.execute("CREATE INDEX IF NOT EXISTS idx_actions_guild_user_pending ON actions(guild_id, user_id, done, ends_at_ts)")
+    await DB.execute("CREATE INDEX IF NOT EXISTS idx_actions_pending ON actions(done, ends_at_ts) WHERE done=0")
+    await DB.commit()
 
-        if channel:
+def schedule_task(row: dict):
+    # Queue the reminder for the scheduler; it posts once ends_at is reached
+    heapq.heappush(_heap, (row["ends_at_ts"], row["id"]))
+    _wake.set()
+
+async def _scheduler():
+    # Sleep until the earliest reminder is due, waking early if a sooner one is queued
+    while True:
+        _wake.clear()
+        if not _heap:
+            await _wake.wait()
+            continue
+        now = time.time()
+        delay = _heap[0][0] + FIRE_WINDOW - now
+        if delay > 0:
             try:
-                await channel.send(msg)
-            except Exception:
+                await asyncio.wait_for(_wake.wait(), timeout=delay)
+            except asyncio.TimeoutError:
                 pass
+            continue
+        row_ids = []
+        while _heap and _heap[0][0] <= now and len(row_ids) < FIRE_BATCH_MAX:
+            row_ids.append(heapq.heappop(_heap)[1])
+        task = asyncio.create_task(_fire(row_ids))
+        _fire_tasks.add(task)
+        task.add_done_callback(_fire_done)
+
+def _fire_done(task: asyncio.Task):
+    _fire_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        log.error("Reminder batch failed", exc_info=task.exception())
+
+async def _resolve_channel(channel_id: int) -> discord.abc.Messageable | None:
+    channel = _channel_cache.get(channel_id)
+    if channel is not None:
+        _channel_cache.move_to_end(channel_id)
+        return channel
+    channel = bot.get_channel(channel_id)
+    if channel is None:
+        now = time.monotonic()
+        while _channel_misses and now - next(iter(_channel_misses.values())) >= CHANNEL_MISS_TTL:
+            _channel_misses.popitem(last=False)
+        if channel_id in _channel_misses:
+            return None
+        # Fallback: try fetch, joining any lookup already in flight for this channel
+        lookup = _channel_lookups.get(channel_id)
+        if lookup is None:
+            lookup = _channel_lookups[channel_id] = asyncio.create_task(bot.fetch_channel(channel_id))
+            lookup.add_done_callback(lambda _: _channel_lookups.pop(channel_id, None))
+        try:
+            channel = await asyncio.shield(lookup)
+        except Exception:
+            _channel_misses[channel_id] = time.monotonic()
+            if len(_channel_misses) > CHANNEL_CACHE_SIZE:
+                _channel_misses.popitem(last=False)
+            return None
+        _channel_misses.pop(channel_id, None)
+    _channel_cache[channel_id] = channel
+    if len(_channel_cache) > CHANNEL_CACHE_SIZE:
+        _channel_cache.popitem(last=False)
+    return channel
 
-    asyncio.create_task(worker())
+async def _fire(row_ids: list[int]):
+    # Claim the rows and read them back in one statement; canceled/already-done ids just don't come back
+    placeholders = ",".join("?" * len(row_ids))
+    cur = await DB.execute(f"""
+        UPDATE actions SET done=1
+        WHERE id IN ({placeholders}) AND done=0
+        RETURNING id, channel_id, user_id, action_type, target, note, ends_at_ts
+    """, row_ids)
+    recs = await cur.fetchall()
+    await DB.commit()
+    await asyncio.gather(*(_send_reminder(rec) for rec in recs))
+
+async def _send_reminder(rec: aiosqlite.Row):
+    channel = await _resolve_channel(rec["channel_id"])
+
+    mention = f"<@{rec['user_id']}>"
+    msg = (
+        f"{mention} **NukeZone action complete!**\n"
+        f"• **Type:** {rec['action_type']}\n"
+        f"• **Target:** {rec['target']}\n"
+        f"• **Finished:** {fmt_dt(datetime.fromtimestamp(rec['ends_at_ts'], tz=timezone.utc))}"
+    )
+    if rec["note"]:
+        msg += f"\n• **Note:** {rec['note']}"
+
+    if channel:
+        try:
+            await channel.send(msg)
+        except (discord.NotFound, discord.Forbidden):
+            # channel deleted or access lost; drop the stale object so the next reminder re-resolves it
+            _channel_cache.pop(rec["channel_id"], None)
+        except Exception:
+            pass
+
+async def _bulk_insert_actions(rows: list[tuple]):
+    # For imports/backfills: rows are (guild_id, user_id, channel_id, action_type, target, note, created_at, ends_at, ends_at_ts).
+    # sqlite3 opens one implicit transaction for the whole executemany, so the batch costs a single commit.
+    cur = await DB.execute("SELECT COALESCE(MAX(id), 0) FROM actions")
+    max_id = (await cur.fetchone())[0]
+    await DB.executemany("""
+        INSERT INTO actions (guild_id, user_id, channel_id, action_type, target, note, created_at, ends_at, ends_at_ts, done)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 0)
+    """, rows)
+    await DB.commit()
+    # Queue just the new rows; ids are AUTOINCREMENT, so they're all above the previous max
+    cur = await DB.execute("SELECT id, ends_at_ts FROM actions WHERE id > ? AND done=0", (max_id,))
+    for r in await cur.fetchall():
+        schedule_task(r)
 
 async def load_and_schedule_all():
-    async with aiosqlite.connect(DB_PATH) as db:
-        db.row_factory = aiosqlite.Row
-        cur = await db.execute("SELECT * FROM actions WHERE done=0")
-        rows = await cur.fetchall()
-        for r in rows:
-            await schedule_task(dict(r))
+    cur = await DB.execute("SELECT id, ends_at_ts FROM actions WHERE done=0")
+    for r in await cur.fetchall():
+        schedule_task(r)
 
 # --------- Commands ---------
 @tree.command(name="action_start", description="Start a NukeZone action timer.")
@@ -149,30 +326,19 @@ async def action_start(
 
     channel_id = channel.id if channel else interaction.channel_id
 
-    async with aiosqlite.connect(DB_PATH) as db:
-        created_at = now.isoformat()
-        ends_at_iso = ends_at.isoformat()
-        await db.execute("""
-            INSERT INTO actions (guild_id, user_id, channel_id, action_type, target, note, created_at, ends_at, done)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0)
-        """, (interaction.guild_id, interaction.user.id, channel_id, action_type, target, note, created_at, ends_at_iso))
-        await db.commit()
-        cur = await db.execute("SELECT last_insert_rowid()")
-        row_id = (await cur.fetchone())[0]
+    created_at = now.isoformat()
+    ends_at_iso = ends_at.isoformat()
+    ends_at_ts = math.ceil(ends_at.timestamp())  # round up so the reminder never fires early
+    cur = await DB.execute("""
+        INSERT INTO actions (guild_id, user_id, channel_id, action_type, target, note, created_at, ends_at, ends_at_ts, done)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 0)
+        RETURNING id
+    """, (interaction.guild_id, interaction.user.id, channel_id, action_type, target, note, created_at, ends_at_iso, ends_at_ts))
+    row_id = (await cur.fetchone())[0]
+    await DB.commit()
 
     # schedule the reminder
-    await schedule_task({
-        "id": row_id,
-        "guild_id": interaction.guild_id,
-        "user_id": interaction.user.id,
-        "channel_id": channel_id,
-        "action_type": action_type,
-        "target": target,
-        "note": note,
-        "created_at": now.isoformat(),
-        "ends_at": ends_at.isoformat(),
-        "done": 0
-    })
+    schedule_task({"id": row_id, "ends_at_ts": ends_at_ts})
 
     await interaction.followup.send(
         f"✅ Timer set (ID `{row_id}`): **{action_type}** → **{target}**\n"
@@ -185,49 +351,78 @@ async def action_start(
 @tree.command(name="action_list", description="List your pending NukeZone action timers.")
 async def action_list(interaction: discord.Interaction):
     await interaction.response.defer(ephemeral=True)
-    now = datetime.now(timezone.utc)
-    async with aiosqlite.connect(DB_PATH) as db:
-        db.row_factory = aiosqlite.Row
-        cur = await db.execute("""
-            SELECT * FROM actions
-            WHERE guild_id=? AND user_id=? AND done=0
-            ORDER BY ends_at ASC
-        """, (interaction.guild_id, interaction.user.id))
-        rows = await cur.fetchall()
+    now_ts = int(time.time())
+    cur = await DB.execute("""
+        SELECT id, action_type, target, ends_at_ts, channel_id FROM actions
+        WHERE guild_id=? AND user_id=? AND done=0
+        ORDER BY ends_at_ts ASC
+    """, (interaction.guild_id, interaction.user.id))
+    rows = await cur.fetchall()
 
     if not rows:
         return await interaction.followup.send("You have no pending actions.", ephemeral=True)
 
-    lines = []
-    for r in rows:
-        ends = datetime.fromisoformat(r["ends_at"])
-        remaining = ends - now
-        remain_str = f"{int(remaining.total_seconds()//3600)}h {int((remaining.total_seconds()%3600)//60)}m"
-        lines.append(
-            f"• ID `{r['id']}` — **{r['action_type']}** → **{r['target']}** | Ends: {fmt_dt(ends)} | ~{remain_str} | <#{r['channel_id']}>"
-        )
-    await interaction.followup.send("\n".join(lines), ephemeral=True)
+    lines = "\n".join(
+        f"• ID `{r['id']}` — **{r['action_type']}** → **{r['target']}** | Ends: {fmt_dt(datetime.fromtimestamp(r['ends_at_ts'], tz=timezone.utc))} | ~{fmt_remaining(r['ends_at_ts'] - now_ts)} | <#{r['channel_id']}>"
+        for r in rows
+    )
+    await interaction.followup.send(lines, ephemeral=True)
 
 @tree.command(name="action_cancel", description="Cancel a pending action timer by ID.")
 @app_commands.describe(action_id="The ID shown in /action_list or returned when created.")
 async def action_cancel(interaction: discord.Interaction, action_id: int):
     await interaction.response.defer(ephemeral=True)
-    async with aiosqlite.connect(DB_PATH) as db:
-        cur = await db.execute("""
-            UPDATE actions SET done=1
-            WHERE id=? AND user_id=? AND guild_id=? AND done=0
-        """, (action_id, interaction.user.id, interaction.guild_id))
-        await db.commit()
-        if cur.rowcount == 0:
-            return await interaction.followup.send("Could not cancel—check the ID or it may already be done.", ephemeral=True)
+    cur = await DB.execute("""
+        UPDATE actions SET done=1
+        WHERE id=? AND user_id=? AND guild_id=? AND done=0
+    """, (action_id, interaction.user.id, interaction.guild_id))
+    await DB.commit()
+    if cur.rowcount == 0:
+        return await interaction.followup.send("Could not cancel—check the ID or it may already be done.", ephemeral=True)
 
     await interaction.followup.send(f"🛑 Canceled timer `{action_id}`.", ephemeral=True)
 
+_owner_id_set: set[int] | None = None
+
+async def _owner_ids() -> set[int]:
+    # discord.Client has no is_owner(); read the owner (or team members) from the application once
+    global _owner_id_set
+    if _owner_id_set is None:
+        app = await bot.application_info()
+        if app.team:
+            _owner_id_set = {m.id for m in app.team.members}
+        else:
+            _owner_id_set = {app.owner.id}
+    return _owner_id_set
+
+@tree.command(name="admin_flush", description="Checkpoint the reminder DB's write-ahead log to disk.")
+@app_commands.guild_only()
+@app_commands.default_permissions(administrator=True)
+async def admin_flush(interaction: discord.Interaction):
+    await interaction.response.defer(ephemeral=True)
+    # The DB is shared by every guild, so only the bot's owner may touch it
+    if interaction.user.id not in await _owner_ids():
+        return await interaction.followup.send("Only the bot owner can run this.", ephemeral=True)
+    cur = await DB.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    busy = (await cur.fetchone())[0]
+    if busy:
+        return await interaction.followup.send("Checkpoint could not complete—the DB is busy, try again shortly.", ephemeral=True)
+
+    await interaction.followup.send("💾 WAL checkpointed and truncated.", ephemeral=True)
+
 # --------- Lifecycle ---------
-@bot.event
-async def on_ready():
+async def setup_hook():
+    # Runs once after login, before the gateway connects, so the DB is ready before any interaction arrives
+    global _scheduler_task
+    await open_db()
     await init_db()
     await load_and_schedule_all()
+    _scheduler_task = asyncio.create_task(_scheduler())
+
+bot.setup_hook = setup_hook
+
+@bot.event
+async def on_ready():
     try:
         await tree.sync()
     except Exception:
@@ -235,8 +430,19 @@ async def on_ready():
     print(f"Logged in as {bot.user} (id: {bot.user.id})")
 
 # --------- Entry ---------
+async def main(token: str):
+    try:
+        async with bot:
+            await bot.start(token)
+    finally:
+        await close_db()
+
 if __name__ == "__main__":
     token = os.getenv("DISCORD_TOKEN")
     if not token:
         raise SystemExit("Set DISCORD_TOKEN env var.")
-    bot.run(token)
+    discord.utils.setup_logging()
+    try:
+        asyncio.run(main(token))
+    except KeyboardInterrupt:
+        pass